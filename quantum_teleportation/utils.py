@@ -1,11 +1,11 @@
 import os
 import uuid
+import numpy as np
 from PIL import Image
 import base64
 import logging
 import colorlog
-from datetime import datetime
-import brotli
+import time
 
 
 def text_from_file(file_path: str) -> str:
@@ -40,7 +40,8 @@ def convert_text_to_binary(text):
     """
     if not isinstance(text, str):
         text = str(text)  # Convert to string if not already a string
-    binary_result = "".join(format(byte, "08b") for byte in bytearray(text, "utf8"))
+    bits = np.unpackbits(np.frombuffer(text.encode("utf-8"), dtype=np.uint8))
+    binary_result = (bits + ord("0")).tobytes().decode("ascii")
     return binary_result
 
 
@@ -54,40 +55,51 @@ def convert_text_to_binary_with_filter(text: str) -> tuple[str, str]:
     Returns:
         Tuple[str, str]: Binary representation of the filtered text and the new filtered text.
     """
-    filtered_text = []
-    binary_result = []
-
-    for char in text:
-        if ord(char) < 256:
-            binary_char = format(ord(char), "08b")
-            binary_result.append(binary_char)
-            filtered_text.append(char)
-        else:
-            print(f"Character {char} is out of ASCII bounds and will be excluded.")
+    # encode() is a single C-level pass; it only raises when the text
+    # actually contains out-of-bounds characters, so clean input never
+    # pays for the per-character filter loop.
+    try:
+        encoded = text.encode("latin-1")
+        filtered_text_str = text
+    except UnicodeEncodeError:
+        # errors="ignore" drops the out-of-bounds characters in the same
+        # C pass; one summary line replaces the per-character print.
+        encoded = text.encode("latin-1", errors="ignore")
+        filtered_text_str = encoded.decode("latin-1")
+        logger.debug(
+            "Excluded %d characters out of ASCII bounds.",
+            len(text) - len(filtered_text_str),
+        )
 
-    binary_result_str = "".join(binary_result)
-    filtered_text_str = "".join(filtered_text)
+    bits = np.unpackbits(np.frombuffer(encoded, dtype=np.uint8))
+    binary_result_str = (bits + ord("0")).tobytes().decode("ascii")
 
     return binary_result_str, filtered_text_str
 
 
-def convert_binary_to_text(binary_list) -> str:
+def convert_binary_to_text(binary_data) -> str:
     """
-    Converts an array of binary strings to text.
+    Converts a binary string (or a list of binary strings) to text.
 
     Args:
-        binary_list (List[str]): List of binary strings.
+        binary_data (str | List[str]): Contiguous binary string or list of
+            binary strings.
 
     Returns:
         str: Text representation of the binary input.
     """
     try:
-        text = bytearray(int(binary, 2) for binary in binary_list).decode("utf-8")
+        merged = binary_data if isinstance(binary_data, str) else "".join(binary_data)
+        bits = np.frombuffer(merged.encode("ascii"), dtype=np.uint8) - ord("0")
+        text = np.packbits(bits).tobytes().decode("utf-8")
         return text
     except Exception as e:
         raise Exception(f"Error converting binary to text: {e} | Perhaps the key is incorrect? Eve is eveing")
 
 
+_BIT_FLIP_TABLE = str.maketrans("01", "10")
+
+
 def bit_flipper(bits: str) -> str:
     """
     Flips bits in the input.
@@ -98,7 +110,10 @@ def bit_flipper(bits: str) -> str:
     Returns:
         str: Flipped bit string.
     """
-    return "".join(["1" if x == "0" else "0" for x in bits])
+    return bits.translate(_BIT_FLIP_TABLE)
+
+
+_TIME_SCALES = ((3600, "hours"), (60, "minutes"))
 
 
 def convert_time(time_seconds):
@@ -111,15 +126,10 @@ def convert_time(time_seconds):
     Returns:
         str: Time in seconds, minutes, or hours.
     """
-    if time_seconds >= 60:
-        time_minutes = time_seconds / 60
-        if time_minutes >= 60:
-            time_hours = time_minutes / 60
-            return f"{time_hours:.2f} hours"
-        else:
-            return f"{time_minutes:.2f} minutes"
-    else:
-        return f"{time_seconds:.2f} seconds"
+    for threshold, unit in _TIME_SCALES:
+        if time_seconds >= threshold:
+            return f"{time_seconds / threshold:.2f} {unit}"
+    return f"{time_seconds:.2f} seconds"
 
 
 def compare_strings(string1: str, string2: str) -> dict:
@@ -133,23 +143,57 @@ def compare_strings(string1: str, string2: str) -> dict:
     Returns:
         dict: A dictionary containing information about the comparison.
     """
-    common_chars = sum(c1 == c2 for c1, c2 in zip(string1, string2))
+    # Identical strings need no per-character work at all; bail out
+    # before the code-point comparison.
+    if string1 == string2:
+        return {
+            "percentage_match": 100.0 if string1 else 100,
+            "differences": [],
+            "marked_string1": string1,
+            "marked_string2": string2,
+            "total_chars": len(string1),
+            "common_chars": len(string1),
+            "string1_length": len(string1),
+            "string2_length": len(string2),
+        }
+
+    # Compare code points in one vectorized pass instead of a per-char
+    # Python loop, then touch only the mismatch positions when building
+    # the ANSI-marked strings.
+    overlap = min(len(string1), len(string2))
+    codes1 = np.frombuffer(string1[:overlap].encode("utf-32-le"), dtype=np.uint32)
+    codes2 = np.frombuffer(string2[:overlap].encode("utf-32-le"), dtype=np.uint32)
+    mismatches = np.nonzero(codes1 != codes2)[0]
+
+    common_chars = overlap - mismatches.size
     total_chars = max(len(string1), len(string2))
     percentage_match = round(
         common_chars / total_chars * 100 if total_chars != 0 else 100, 2
     )
 
-    differences = []
-    marked_string1 = ""
-    marked_string2 = ""
-    for i, (c1, c2) in enumerate(zip(string1, string2)):
-        if c1 != c2:
-            differences.append((i, c1, c2))
-            marked_string1 += f"\033[91m{c1}\033[0m"
-            marked_string2 += f"\033[91m{c2}\033[0m"
-        else:
-            marked_string1 += c1
-            marked_string2 += c2
+    differences = [(int(i), string1[i], string2[i]) for i in mismatches]
+
+    # Group adjacent mismatch indices into runs so each run gets one
+    # escape pair rather than one per character.
+    runs = (
+        np.split(mismatches, np.nonzero(np.diff(mismatches) > 1)[0] + 1)
+        if mismatches.size
+        else []
+    )
+
+    def _mark(string: str) -> str:
+        parts = []
+        prev = 0
+        for run in runs:
+            start, stop = run[0], run[-1] + 1
+            parts.append(string[prev:start])
+            parts.append(f"\033[91m{string[start:stop]}\033[0m")
+            prev = stop
+        parts.append(string[prev:overlap])
+        return "".join(parts)
+
+    marked_string1 = _mark(string1)
+    marked_string2 = _mark(string2)
 
     return {
         "percentage_match": percentage_match,
@@ -174,13 +218,11 @@ def xor_encode(binary: str, key: str) -> str:
     Returns:
         str: Encoded binary string.
     """
-    encoded_binary = ""
-    for bit1, bit2 in zip(binary, key):
-        if bit1 != bit2:
-            encoded_binary += "1"
-        else:
-            encoded_binary += "0"
-    return encoded_binary
+    a = np.frombuffer(binary.encode("ascii"), dtype=np.uint8)
+    b = np.frombuffer(key.encode("ascii"), dtype=np.uint8)
+    n = min(a.size, b.size)
+    encoded = (a[:n] ^ b[:n]) | ord("0")
+    return encoded.tobytes().decode("ascii")
 
 
 def xor_decode(encoded_binary: str, key: str) -> str:
@@ -194,13 +236,11 @@ def xor_decode(encoded_binary: str, key: str) -> str:
     Returns:
         str: Decoded binary string.
     """
-    decoded_binary = ""
-    for bit1, bit2 in zip(encoded_binary, key):
-        if bit1 != bit2:
-            decoded_binary += "1"
-        else:
-            decoded_binary += "0"
-    return decoded_binary
+    a = np.frombuffer(encoded_binary.encode("ascii"), dtype=np.uint8)
+    b = np.frombuffer(key.encode("ascii"), dtype=np.uint8)
+    n = min(a.size, b.size)
+    decoded = (a[:n] ^ b[:n]) | ord("0")
+    return decoded.tobytes().decode("ascii")
 
 
 def image_to_binary(image_path, grayscale=True, threshold=None):
@@ -222,13 +262,14 @@ def image_to_binary(image_path, grayscale=True, threshold=None):
         img = img.convert("L")
 
     if threshold is not None:
-        img = img.point(lambda p: p > threshold and 255)
+        # A 256-entry byte table takes PIL's C LUT path; a Python lambda
+        # in point() falls back to one interpreter call per pixel.
+        lut = bytes(255 if p > threshold else 0 for p in range(256))
+        img = img.point(lut)
 
-    pixels = list(img.getdata())
-
-    binary_data = [format(pixel, "08b") for pixel in pixels]
-
-    binary_string = "".join(binary_data)
+    pixels = np.asarray(img, dtype=np.uint8).ravel()
+    bits = np.unpackbits(pixels)
+    binary_string = (bits + ord("0")).tobytes().decode("ascii")
 
     return binary_string
 
@@ -243,9 +284,15 @@ def image_to_base64(image_path: str) -> str:
     Returns:
         str: Base64 encoded string representing the image.
     """
+    # Encode in 57 KB blocks (a multiple of the 3-byte base64 quantum, so
+    # no chunk emits padding) instead of slurping the whole file; peak
+    # memory stays bounded for large images.
+    encoded_parts = []
     with open(image_path, "rb") as image_file:
-        encoded_image = base64.b64encode(image_file.read()).decode("utf-8")
-    print(f"Encoded image: {encoded_image}")
+        while chunk := image_file.read(57 * 1024):
+            encoded_parts.append(base64.b64encode(chunk))
+    encoded_image = b"".join(encoded_parts).decode("utf-8")
+    print(f"Encoded image: {len(encoded_image)} characters")
     return encoded_image
 
 
@@ -260,10 +307,13 @@ def base64_to_image(base64_string, output_path):
     Returns:
         str: Path to the saved image file.
     """
-    image_data = base64.b64decode(base64_string)
-
-    with open(output_path, "wb") as image_file:
-        image_file.write(image_data)
+    # Decode in 76 KB blocks (a multiple of the 4-char base64 quantum) so
+    # the decoded copy never has to sit in memory alongside the input.
+    with open(output_path, "wb", buffering=1024 * 1024) as image_file:
+        for start in range(0, len(base64_string), 76 * 1024):
+            image_file.write(
+                base64.b64decode(base64_string[start : start + 76 * 1024])
+            )
 
     return output_path
 
@@ -276,10 +326,13 @@ def handle_flipped_results(flipped_results: list[str], logs: bool = False) -> li
         list: List of bytes (8-bit chunks).
     """
     merged_binary = "".join(flipped_results)
-    bytes_list = []
-    for i in range(0, len(merged_binary), 8):
-        byte = merged_binary[i : i + 8]
-        bytes_list.append(byte)
+    usable_length = len(merged_binary) - len(merged_binary) % 8
+    chunks = np.frombuffer(
+        merged_binary.encode("ascii"), dtype=np.uint8, count=usable_length
+    ).reshape(-1, 8)
+    bytes_list = [chunk.decode("ascii") for chunk in chunks.view("S8").ravel()]
+    if len(merged_binary) > usable_length:
+        bytes_list.append(merged_binary[usable_length:])
     if logs:
         print(f"Merged binary: {merged_binary}")
         print(f"Bytes list: {bytes_list}")
@@ -295,59 +348,85 @@ def save_data(converted_chunks, output_path, image_path=None, data=None):
         output_path (str): Path to the directory where the data will be saved.
         image_path (str, optional): Path to the original image file if applicable. Defaults to None.
     """
-    print(f"Output path: {output_path} | Image path: {image_path}")
     if output_path is None:
-        print("No output path provided. Data will not be saved.")
+        logger.debug("No output path provided. Data will not be saved.")
         return
 
+    logger.debug("Output path: %s | Image path: %s", output_path, image_path)
+
     if not "/" in output_path and not "\\" in output_path:
         output_path = output_path + "/"
 
-    if not os.path.isdir(output_path):
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        print(f"Created directory: {os.path.dirname(output_path)}")
-
-    if os.path.isdir(output_path):
+    if output_path.endswith(("/", "\\")) or os.path.isdir(output_path):
+        # Directory target: create the directory itself (the old code
+        # only made its parent, so "out/" never existed on first use) and
+        # pick a filename inside it.
+        os.makedirs(output_path, exist_ok=True)
         if image_path:
             filename = os.path.basename(image_path)
         else:
             filename = f"output_{uuid.uuid4().hex[:8]}.txt"
         output_file_path = os.path.join(output_path, filename)
-        print(f"Output file path: {output_file_path}")
     else:
+        parent = os.path.dirname(output_path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
         output_file_path = output_path
-        print(f"Output file path: {output_file_path}")
+    logger.debug("Output file path: %s", output_file_path)
 
     if image_path:
-        print(f"Image path: {image_path}")
         output_file_path = output_file_path.replace(
             ".txt", os.path.splitext(image_path)[1]
         )
-        print(f"Output file path after extension: {output_file_path}")
-        base64_to_image(converted_chunks, output_file_path)
-        print(f"Saved image to: {output_file_path}")
+        logger.debug("Output file path after extension: %s", output_file_path)
+        if isinstance(converted_chunks, (bytes, bytearray)):
+            # Raw image bytes arrive directly from the bit stream; no
+            # base64 round-trip to undo.
+            with open(output_file_path, "wb") as image_file:
+                image_file.write(converted_chunks)
+        else:
+            base64_to_image(converted_chunks, output_file_path)
+        logger.debug("Saved image to: %s", output_file_path)
     else:
         if isinstance(converted_chunks, str):
+            # Assemble the header and payload once and write in a single
+            # call instead of one write per line.
+            parts = [f"time: {_current_timestamp()} IST\n"]
+            if data:
+                parts.extend(f"{key}: {value}\n" for key, value in data.items())
+                parts.append("--------------------\n\n")
+            parts.append(converted_chunks)
             with open(output_file_path, "w") as f:
-                f.write(f"time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} IST\n")
-                if data:
-                    for key, value in data.items():
-                        f.write(f"{key}: {value}\n")
-                    f.write("--------------------\n\n")
-                f.write(converted_chunks)
-                print(f"Saved text data to: {output_file_path}")
+                f.write("".join(parts))
+            logger.debug("Saved text data to: %s", output_file_path)
         else:
-            with open(output_file_path, "wb") as f:
+            with open(output_file_path, "wb", buffering=1024 * 1024) as f:
                 f.write(converted_chunks)
-                print(f"Saved binary data to: {output_file_path}")
+            logger.debug("Saved binary data to: %s", output_file_path)
 
     return output_file_path
 
 
+_last_time_sec = 0
+_last_time_str = ""
+
+
+def _current_timestamp() -> str:
+    """
+    Returns the formatted wall-clock time, cached per second; timestamp
+    formatting otherwise runs once per log record on hot paths.
+    """
+    global _last_time_sec, _last_time_str
+    sec = int(time.time())
+    if sec != _last_time_sec:
+        _last_time_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+        _last_time_sec = sec
+    return _last_time_str
+
+
 class ColoredFormatter(colorlog.ColoredFormatter):
     def format(self, record):
-        log_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        record.log_time = log_time
+        record.log_time = _current_timestamp()
         return super().format(record)
 
 
@@ -355,6 +434,12 @@ def setup_logger(name, level=logging.DEBUG):
     logger = logging.getLogger(name)
     logger.setLevel(level)
 
+    # Repeat calls for the same name (re-imports, helper reinits) must not
+    # stack handlers, or every record gets emitted once per call.
+    if logger.handlers:
+        return logger
+    logger.propagate = False
+
     formatter = ColoredFormatter(
         "%(log_color)s[%(log_time)s] [%(levelname)s]: %(message)s",
         datefmt=None,
@@ -376,3 +461,6 @@ def setup_logger(name, level=logging.DEBUG):
     logger.addHandler(stream_handler)
 
     return logger
+
+
+logger = setup_logger("utils")